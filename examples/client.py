@@ -5,39 +5,58 @@ import requests
 import time
 from typing import Dict, Any
 
+from requests.adapters import HTTPAdapter
+
 class LeKiwiClient:
-    """Simple client for interacting with LeKiwi Control Center API."""
+    """Simple client for interacting with LeKiwi Control Center API.
+
+    All requests go through a single keep-alive session, so repeated commands
+    (e.g. teleop loops) reuse the same TCP connection instead of opening a new one per call.
+    """
 
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        self.session.mount(self.base_url, HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "LeKiwiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
 
     def health_check(self) -> Dict[str, Any]:
         """Check if the server is healthy."""
-        response = requests.get(f"{self.base_url}/health")
+        response = self.session.get(f"{self.base_url}/health")
         response.raise_for_status()
         return response.json()
 
     def get_status(self) -> Dict[str, Any]:
         """Get robot connection status."""
-        response = requests.get(f"{self.base_url}/status")
+        response = self.session.get(f"{self.base_url}/status")
         response.raise_for_status()
         return response.json()
 
     def connect(self) -> Dict[str, Any]:
         """Connect to the robot."""
-        response = requests.post(f"{self.base_url}/robot/connect")
+        response = self.session.post(f"{self.base_url}/robot/connect")
         response.raise_for_status()
         return response.json()
 
     def disconnect(self) -> Dict[str, Any]:
         """Disconnect from the robot."""
-        response = requests.post(f"{self.base_url}/robot/disconnect")
+        response = self.session.post(f"{self.base_url}/robot/disconnect")
         response.raise_for_status()
         return response.json()
 
     def get_motors_state(self) -> Dict[str, Any]:
         """Get current motor positions and velocities."""
-        response = requests.get(f"{self.base_url}/motors/state")
+        response = self.session.get(f"{self.base_url}/motors/state")
         response.raise_for_status()
         return response.json()
 
@@ -59,32 +78,32 @@ class LeKiwiClient:
             "arm_wrist_roll": wrist_roll,
             "arm_gripper": gripper,
         }
-        response = requests.post(f"{self.base_url}/motors/arm/position", json=payload)
+        response = self.session.post(f"{self.base_url}/motors/arm/position", json=payload)
         response.raise_for_status()
         return response.json()
 
     def set_base_velocity(self, x: float = 0.0, y: float = 0.0, theta: float = 0.0) -> Dict[str, Any]:
         """Set base velocities."""
         payload = {"x": x, "y": y, "theta": theta}
-        response = requests.post(f"{self.base_url}/motors/base/velocity", json=payload)
+        response = self.session.post(f"{self.base_url}/motors/base/velocity", json=payload)
         response.raise_for_status()
         return response.json()
 
     def stop(self) -> Dict[str, Any]:
         """Emergency stop."""
-        response = requests.post(f"{self.base_url}/motors/stop")
+        response = self.session.post(f"{self.base_url}/motors/stop")
         response.raise_for_status()
         return response.json()
 
     def list_cameras(self) -> Dict[str, Any]:
         """List available cameras."""
-        response = requests.get(f"{self.base_url}/cameras/list")
+        response = self.session.get(f"{self.base_url}/cameras/list")
         response.raise_for_status()
         return response.json()
 
     def get_camera_frame(self, camera_id: str, save_path: str = None) -> bytes:
         """Get a single frame from camera."""
-        response = requests.get(f"{self.base_url}/cameras/{camera_id}/frame")
+        response = self.session.get(f"{self.base_url}/cameras/{camera_id}/frame")
         response.raise_for_status()
 
         if save_path:
@@ -94,10 +113,75 @@ class LeKiwiClient:
         return response.content
 
 
+class AsyncLeKiwiClient:
+    """Asyncio variant of :class:`LeKiwiClient` backed by a pooled ``httpx.AsyncClient``."""
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        import httpx
+
+        self.base_url = base_url.rstrip("/")
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncLeKiwiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _get(self, path: str) -> Dict[str, Any]:
+        response = await self.client.get(path)
+        response.raise_for_status()
+        return response.json()
+
+    async def _post(self, path: str, payload: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        response = await self.client.post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check if the server is healthy."""
+        return await self._get("/health")
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Get robot connection status."""
+        return await self._get("/status")
+
+    async def connect(self) -> Dict[str, Any]:
+        """Connect to the robot."""
+        return await self._post("/robot/connect")
+
+    async def disconnect(self) -> Dict[str, Any]:
+        """Disconnect from the robot."""
+        return await self._post("/robot/disconnect")
+
+    async def get_motors_state(self) -> Dict[str, Any]:
+        """Get current motor positions and velocities."""
+        return await self._get("/motors/state")
+
+    async def set_base_velocity(self, x: float = 0.0, y: float = 0.0, theta: float = 0.0) -> Dict[str, Any]:
+        """Set base velocities."""
+        return await self._post("/motors/base/velocity", {"x": x, "y": y, "theta": theta})
+
+    async def stop(self) -> Dict[str, Any]:
+        """Emergency stop."""
+        return await self._post("/motors/stop")
+
+
 def main():
     """Example usage of the LeKiwi client."""
-    client = LeKiwiClient("http://192.168.1.100:8000")  # Update with your robot's IP
+    with LeKiwiClient("http://192.168.1.100:8000") as client:  # Update with your robot's IP
+        run_demo(client)
+
 
+def run_demo(client: LeKiwiClient):
+    """Run a short connect / move / capture / disconnect sequence."""
     # Check health
     print("Health:", client.health_check())
 
@@ -0,0 +1,135 @@
+# ABOUTME: Request coalescing for robot reads and motor commands shared by all API clients
+# ABOUTME: Concurrent reads share one bus transaction and bursts of commands collapse to the latest one
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+
+from lekiwi_control.robot.lekiwi import LeKiwi
+
+# Reads younger than this are handed to new callers instead of touching the bus again
+READ_MAX_AGE_S = 0.02
+
+
+class SingleFlight:
+    """Runs a read at most once at a time and shares its result.
+
+    `read` is either a blocking function, run on the threadpool, or a coroutine function. Callers
+    arriving while a read is in flight await that read instead of starting their own, and a result
+    younger than `max_age_s` is returned without reading at all.
+    """
+
+    def __init__(self, read: Callable[[], Any], max_age_s: float = READ_MAX_AGE_S):
+        self.read = read
+        self._is_async = asyncio.iscoroutinefunction(read)
+        self.max_age_s = max_age_s
+        self._result: tuple[float, Any] | None = None
+        self._inflight: asyncio.Future | None = None
+
+    async def get(self) -> Any:
+        if self._result is not None and time.perf_counter() - self._result[0] < self.max_age_s:
+            return self._result[1]
+
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._run())
+        # Shield so one caller disconnecting does not cancel the read for everybody else
+        return await asyncio.shield(self._inflight)
+
+    async def _run(self) -> Any:
+        try:
+            value = await self.read() if self._is_async else await run_in_threadpool(self.read)
+            self._result = (time.perf_counter(), value)
+            return value
+        finally:
+            self._inflight = None
+
+
+class LatestActionSender:
+    """Serializes motor commands through one worker task with a single pending slot.
+
+    A command submitted while another is waiting to be written replaces it; every caller whose
+    command was replaced receives the result of the command that was actually sent. Base stops
+    go through the same worker and are never replaced, so no earlier command can land after them.
+    """
+
+    # Result reported for a base stop, and to the callers whose commands a stop discarded
+    STOPPED = {"base": "stopped"}
+
+    def __init__(self, robot: LeKiwi):
+        self.robot = robot
+        self._pending: dict[str, Any] | None = None
+        self._waiters: list[asyncio.Future] = []
+        self._stop_waiters: list[asyncio.Future] = []
+        self._task: asyncio.Task | None = None
+
+    async def send(self, action: dict[str, Any]) -> dict[str, Any]:
+        """Queue `action` for the bus and wait until it (or a newer command) has been written.
+
+        Returns:
+            The action actually sent, as returned by `LeKiwi.send_action`
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending = action
+        self._waiters.append(waiter)
+        self._ensure_worker()
+        return await waiter
+
+    async def stop(self) -> dict[str, Any]:
+        """Drop any queued command and stop the base right after the command being written, if any.
+
+        Returns:
+            `STOPPED`
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        superseded, self._pending, self._waiters = self._waiters, None, []
+        self._stop_waiters.append(waiter)
+        self._ensure_worker()
+        self._settle(superseded, self.STOPPED)
+        return await waiter
+
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._stop_waiters or self._pending is not None:
+            if self._stop_waiters:
+                waiters, self._stop_waiters = self._stop_waiters, []
+                try:
+                    await run_in_threadpool(self.robot.stop_base)
+                except Exception as e:
+                    self._settle(waiters, error=e)
+                else:
+                    self._settle(waiters, self.STOPPED)
+                continue
+
+            action, waiters = self._pending, self._waiters
+            self._pending, self._waiters = None, []
+            try:
+                result = await run_in_threadpool(self.robot.send_action, action)
+            except Exception as e:
+                self._settle(waiters, error=e)
+            else:
+                self._settle(waiters, result)
+
+    @staticmethod
+    def _settle(waiters: list[asyncio.Future], result: Any = None, error: Exception | None = None) -> None:
+        for waiter in waiters:
+            if not waiter.done():
+                if error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(result)
+
+
+class RobotCoalescer:
+    """Per-robot coalescing front end used by the API routes."""
+
+    def __init__(self, robot: LeKiwi):
+        self.robot = robot
+        self.motors_state = SingleFlight(robot.get_motors_state)
+        self.observation = SingleFlight(robot.get_observation_async)
+        self.actions = LatestActionSender(robot)
@@ -1,42 +1,44 @@
 # ABOUTME: FastAPI dependency injection for robot instance management
-# ABOUTME: Provides singleton access to the LeKiwi robot instance
+# ABOUTME: Provides access to the LeKiwi robot instance bound in the application lifespan state
 
 from typing import Optional
 
-from lekiwi_control.robot.lekiwi import LeKiwi
+from fastapi.requests import HTTPConnection
 
-# Global robot instance
-_robot_instance: Optional[LeKiwi] = None
+from lekiwi_control.api.coalescing import RobotCoalescer
+from lekiwi_control.robot.lekiwi import LeKiwi
 
 
-def get_robot() -> LeKiwi:
+def get_robot(connection: HTTPConnection) -> LeKiwi:
     """Get the robot instance.
 
+    The instance is created once in the application lifespan and handed to every request through
+    the lifespan state, so resolving it is a plain attribute lookup.
+
     Raises:
-        RuntimeError: If robot is not initialized.
+        AttributeError: If the application lifespan has not bound a robot.
 
     Returns:
         LeKiwi: The robot instance.
     """
-    if _robot_instance is None:
-        raise RuntimeError("Robot not initialized. Call initialize_robot() first.")
-    return _robot_instance
+    return connection.state.robot
 
 
-def initialize_robot(robot: LeKiwi) -> None:
-    """Initialize the global robot instance.
+def get_coalescer(connection: HTTPConnection) -> RobotCoalescer:
+    """Get the request coalescer shared by all clients of the robot.
 
-    Args:
-        robot: The LeKiwi robot instance to use.
+    Like the robot, it is created once in the application lifespan and bound in the lifespan state.
+
+    Returns:
+        RobotCoalescer: The coalescer wrapping the robot instance.
     """
-    global _robot_instance
-    _robot_instance = robot
+    return connection.state.coalescer
 
 
-def get_robot_or_none() -> Optional[LeKiwi]:
+def get_robot_or_none(connection: HTTPConnection) -> Optional[LeKiwi]:
     """Get the robot instance or None if not initialized.
 
     Returns:
         Optional[LeKiwi]: The robot instance or None.
     """
-    return _robot_instance
+    return getattr(connection.state, "robot", None)
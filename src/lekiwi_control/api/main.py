@@ -5,34 +5,47 @@ import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from lekiwi_control import __version__
-from lekiwi_control.api.dependencies import initialize_robot
-from lekiwi_control.api.routes import cameras_router, health_router, motors_router, robot_router
+from lekiwi_control.api.coalescing import RobotCoalescer
+from lekiwi_control.api.routes import (
+    cameras_router,
+    health_router,
+    motors_router,
+    robot_router,
+    telemetry_router,
+)
 from lekiwi_control.robot.config import LeKiwiConfig
+from lekiwi_control.robot.errors import RobotError, RobotNotConnectedError
 from lekiwi_control.robot.lekiwi import LeKiwi
+from lekiwi_control.utils import DeviceNotConnectedError
 
 logger = logging.getLogger(__name__)
 
+# Sync route handlers and run_in_threadpool() calls share AnyIO's default thread limiter
+THREADPOOL_SIZE = 64
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
     # Startup
     logger.info("Starting LeKiwi Control Center API v%s", __version__)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
 
     # Initialize robot with default config
     config = LeKiwiConfig()
     robot = LeKiwi(config)
-    initialize_robot(robot)
 
     logger.info("Robot initialized. Use /robot/connect to connect to hardware.")
 
-    yield
+    # Exposed to every request as request.state.robot / .coalescer (see dependencies)
+    yield {"robot": robot, "coalescer": RobotCoalescer(robot)}
 
     # Shutdown
     logger.info("Shutting down LeKiwi Control Center")
@@ -50,6 +63,7 @@ app = FastAPI(
     description="REST API for controlling the LeKiwi robot",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -61,33 +75,65 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# Robot errors propagate out of the routes and are mapped to status codes here
+@app.exception_handler(RobotNotConnectedError)
+@app.exception_handler(DeviceNotConnectedError)
+async def not_connected_handler(request: Request, exc: DeviceNotConnectedError):
+    return ORJSONResponse({"detail": str(exc)}, status_code=503)
+
+
+@app.exception_handler(RobotError)
+async def robot_error_handler(request: Request, exc: RobotError):
+    logger.warning("%s %s failed: %s", request.method, request.url.path, exc)
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
+
 # Register routers
 app.include_router(health_router)
 app.include_router(robot_router)
 app.include_router(motors_router)
 app.include_router(cameras_router)
+app.include_router(telemetry_router)
+
+# Static files directory and control page, resolved once at import
+STATIC_DIR = (Path(__file__).parent.parent.parent.parent / "static").resolve()
+CONTROL_PAGE = STATIC_DIR / "control.html"
+CONTROL_PAGE_EXISTS = CONTROL_PAGE.is_file()
 
 # Mount static files directory
-static_dir = Path(__file__).parent.parent.parent.parent / "static"
-if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+if STATIC_DIR.exists():
+    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 
 # Serve control page
 @app.get("/")
 async def serve_control_page():
     """Serve the robot control web interface."""
-    control_page = static_dir / "control.html"
-    if control_page.exists():
-        return FileResponse(control_page)
+    if CONTROL_PAGE_EXISTS:
+        return FileResponse(CONTROL_PAGE)
     return {"message": "Control page not found. Please create static/control.html"}
 
 
 def main():
-    """Main entry point for the LeKiwi control center server."""
+    """Main entry point for the LeKiwi control center server.
+
+    The server always runs a single worker process: the motor bus serial port and the cameras can
+    only be owned by one process, and blocking hardware calls already run on the threadpool.
+    """
+    import importlib.util
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        workers=1,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+    )
 
 
 if __name__ == "__main__":
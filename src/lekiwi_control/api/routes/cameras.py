@@ -1,15 +1,19 @@
 # ABOUTME: Camera access endpoints for capturing images from robot cameras
 # ABOUTME: Provides JPEG image capture and MJPEG streaming from front and wrist cameras
 
+import hashlib
 import io
 
-import cv2
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from lekiwi_control.api.dependencies import get_robot
+from lekiwi_control.api.coalescing import RobotCoalescer
+from lekiwi_control.api.dependencies import get_coalescer, get_robot
 from lekiwi_control.api.models import CameraListResponse
+from lekiwi_control.api.streaming import MJPEG_MEDIA_TYPE, get_streamer
+from lekiwi_control.cameras.utils import encode_jpeg
 from lekiwi_control.robot.lekiwi import LeKiwi
 
 router = APIRouter(prefix="/cameras", tags=["cameras"])
@@ -21,18 +25,26 @@ async def list_cameras(robot: LeKiwi = Depends(get_robot)):
     if not robot.is_connected:
         raise HTTPException(status_code=503, detail="Robot not connected")
 
-    return CameraListResponse(cameras=list(robot.cameras.keys()))
+    return ORJSONResponse({"cameras": list(robot.cameras)})
 
 
 @router.get("/{camera_id}/frame")
-async def get_camera_frame(camera_id: str, robot: LeKiwi = Depends(get_robot)):
+async def get_camera_frame(
+    camera_id: str,
+    request: Request,
+    robot: LeKiwi = Depends(get_robot),
+    coalescer: RobotCoalescer = Depends(get_coalescer),
+):
     """Get a single frame from the specified camera as JPEG.
 
+    The response carries an ETag derived from the encoded image, so polling clients sending
+    `If-None-Match` get an empty 304 when the frame has not changed.
+
     Args:
         camera_id: Camera identifier ('front' or 'wrist')
 
     Returns:
-        JPEG image
+        JPEG image, or 304 Not Modified
     """
     if not robot.is_connected:
         raise HTTPException(status_code=503, detail="Robot not connected")
@@ -42,28 +54,37 @@ async def get_camera_frame(camera_id: str, robot: LeKiwi = Depends(get_robot)):
             status_code=404, detail=f"Camera '{camera_id}' not found. Available: {list(robot.cameras.keys())}"
         )
 
-    try:
-        # Get observation which includes camera frames
-        observation = robot.get_observation()
-        frame = observation[camera_id]
+    # Get observation which includes camera frames, shared with concurrent callers
+    observation = await coalescer.observation.get()
+    frame = observation[camera_id]
 
-        # Encode as JPEG
-        ret, buffer = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
-        if not ret:
-            raise HTTPException(status_code=500, detail="Failed to encode image")
+    # Encode as JPEG
+    jpeg = await run_in_threadpool(encode_jpeg, frame, 90)
+    if jpeg is None:
+        raise HTTPException(status_code=500, detail="Failed to encode image")
 
-        return Response(content=buffer.tobytes(), media_type="image/jpeg")
+    etag = f'"{hashlib.blake2b(jpeg, digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to capture frame: {str(e)}")
+    return Response(
+        content=jpeg,
+        media_type="image/jpeg",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
 
 
 @router.get("/{camera_id}/stream")
-async def stream_camera(camera_id: str, robot: LeKiwi = Depends(get_robot)):
+async def stream_camera(
+    camera_id: str,
+    w: int | None = Query(None, gt=0, description="Downscale frames to this width (keeps aspect ratio)"),
+    robot: LeKiwi = Depends(get_robot),
+):
     """Stream camera frames as MJPEG.
 
     Args:
         camera_id: Camera identifier ('front' or 'wrist')
+        w: Optional output width; frames wider than this are downscaled before encoding
 
     Returns:
         MJPEG stream
@@ -76,30 +97,22 @@ async def stream_camera(camera_id: str, robot: LeKiwi = Depends(get_robot)):
             status_code=404, detail=f"Camera '{camera_id}' not found. Available: {list(robot.cameras.keys())}"
         )
 
-    def generate_frames():
-        """Generator function for streaming frames."""
+    streamer = get_streamer(camera_id, robot.cameras[camera_id], w)
+
+    async def generate_frames():
+        """Yield the latest shared frame in MJPEG format whenever a new one is published."""
+        cache = await streamer.subscribe()
         try:
+            seq = 0
             while True:
-                # Get current frame
-                observation = robot.get_observation()
-                frame = observation[camera_id]
-
-                # Encode as JPEG
-                ret, buffer = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
-                if not ret:
-                    continue
+                item = await cache.wait_next(seq)
+                if item is None:
+                    break
+                seq, _ = item
 
                 # Yield frame in MJPEG format
-                yield (
-                    b"--frame\r\n"
-                    b"Content-Type: image/jpeg\r\n\r\n" + buffer.tobytes() + b"\r\n"
-                )
-
-        except GeneratorExit:
-            pass
-        except Exception:
-            pass
-
-    return StreamingResponse(
-        generate_frames(), media_type="multipart/x-mixed-replace; boundary=frame"
-    )
+                yield cache.mjpeg_part()
+        finally:
+            streamer.unsubscribe()
+
+    return StreamingResponse(generate_frames(), media_type=MJPEG_MEDIA_TYPE)
@@ -1,7 +1,9 @@
 # ABOUTME: Health check and status endpoints for the LeKiwi control center
 # ABOUTME: Provides system health monitoring and robot connection status
 
+import orjson
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, Response
 
 from lekiwi_control import __version__
 from lekiwi_control.api.dependencies import get_robot_or_none
@@ -10,17 +12,24 @@ from lekiwi_control.robot.lekiwi import LeKiwi
 
 router = APIRouter(prefix="", tags=["health"])
 
+# The health payload never changes, so it is serialized once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "version": __version__})
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(status="healthy", version=__version__)
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/status", response_model=RobotStatusResponse)
-async def get_status(robot: LeKiwi | None = Depends(get_robot_or_none)):
-    """Get robot connection and calibration status."""
+def get_status(robot: LeKiwi | None = Depends(get_robot_or_none)):
+    """Get robot connection and calibration status.
+
+    Sync so the calibration check, which reads every motor over the bus, runs on the threadpool
+    instead of blocking the event loop.
+    """
     if robot is None:
-        return RobotStatusResponse(connected=False, calibrated=False)
+        return ORJSONResponse({"connected": False, "calibrated": False})
 
-    return RobotStatusResponse(connected=robot.is_connected, calibrated=robot.is_calibrated)
+    return ORJSONResponse({"connected": robot.is_connected, "calibrated": robot.is_calibrated})
@@ -1,9 +1,14 @@
 # ABOUTME: Motor control endpoints for arm and base motors
 # ABOUTME: Provides REST API for reading motor state and sending position/velocity commands
 
+import sys
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from lekiwi_control.api.dependencies import get_robot
+from lekiwi_control.api.coalescing import RobotCoalescer
+from lekiwi_control.api.dependencies import get_coalescer, get_robot
 from lekiwi_control.api.models import (
     ActionResponse,
     ArmPositionRequest,
@@ -14,72 +19,84 @@ from lekiwi_control.robot.lekiwi import LeKiwi
 
 router = APIRouter(prefix="/motors", tags=["motors"])
 
+ARM_MOTORS = (
+    "arm_shoulder_pan",
+    "arm_shoulder_lift",
+    "arm_elbow_flex",
+    "arm_wrist_flex",
+    "arm_wrist_roll",
+    "arm_gripper",
+)
+# (motor name, "<motor>.pos" state key) pairs, built once instead of per payload
+_ARM_POS_KEYS = tuple((name, sys.intern(name + ".pos")) for name in ARM_MOTORS)
 
-@router.get("/state", response_model=MotorsStateResponse)
-async def get_motors_state(robot: LeKiwi = Depends(get_robot)):
-    """Get current state of all motors (positions and velocities)."""
-    if not robot.is_connected:
-        raise HTTPException(status_code=503, detail="Robot not connected")
 
-    try:
-        observation = robot.get_observation()
+def motors_state_payload(state: dict) -> dict:
+    """Build the MotorsStateResponse-shaped payload from `LeKiwi.get_motors_state()` output."""
+    return {
+        "arm_motors": {name: state[key] for name, key in _ARM_POS_KEYS},
+        "base_velocities": {
+            "x": state["x.vel"],
+            "y": state["y.vel"],
+            "theta": state["theta.vel"],
+        },
+    }
 
-        # Extract arm positions
-        arm_motors = {
-            "arm_shoulder_pan": observation["arm_shoulder_pan.pos"],
-            "arm_shoulder_lift": observation["arm_shoulder_lift.pos"],
-            "arm_elbow_flex": observation["arm_elbow_flex.pos"],
-            "arm_wrist_flex": observation["arm_wrist_flex.pos"],
-            "arm_wrist_roll": observation["arm_wrist_roll.pos"],
-            "arm_gripper": observation["arm_gripper.pos"],
-        }
 
-        # Extract base velocities
-        base_velocities = {
-            "x": observation["x.vel"],
-            "y": observation["y.vel"],
-            "theta": observation["theta.vel"],
-        }
+@router.get("/state", response_model=MotorsStateResponse)
+async def get_motors_state(
+    robot: LeKiwi = Depends(get_robot), coalescer: RobotCoalescer = Depends(get_coalescer)
+):
+    """Get current state of all motors (positions and velocities).
 
-        return MotorsStateResponse(arm_motors=arm_motors, base_velocities=base_velocities)
+    The payload is returned as an ORJSONResponse directly, so FastAPI skips building and
+    validating a MotorsStateResponse; the response_model is kept for the OpenAPI schema.
+    """
+    if not robot.is_connected:
+        raise HTTPException(status_code=503, detail="Robot not connected")
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to read motor state: {str(e)}")
+    state = await coalescer.motors_state.get()
+    return ORJSONResponse(motors_state_payload(state))
 
 
 @router.post("/arm/position", response_model=ActionResponse)
-async def set_arm_position(request: ArmPositionRequest, robot: LeKiwi = Depends(get_robot)):
+async def set_arm_position(
+    request: ArmPositionRequest,
+    robot: LeKiwi = Depends(get_robot),
+    coalescer: RobotCoalescer = Depends(get_coalescer),
+):
     """Set target positions for arm motors.
 
     Positions are in normalized units based on calibration.
-    Base velocities are set to 0.
+    Base velocities are set to 0. Commands arriving faster than the bus can take them are
+    coalesced, and superseded requests report the newer action that was sent.
     """
     if not robot.is_connected:
         raise HTTPException(status_code=503, detail="Robot not connected")
 
-    try:
-        # Build action dict
-        action = {
-            "arm_shoulder_pan.pos": request.arm_shoulder_pan,
-            "arm_shoulder_lift.pos": request.arm_shoulder_lift,
-            "arm_elbow_flex.pos": request.arm_elbow_flex,
-            "arm_wrist_flex.pos": request.arm_wrist_flex,
-            "arm_wrist_roll.pos": request.arm_wrist_roll,
-            "arm_gripper.pos": request.arm_gripper,
-            "x.vel": 0.0,
-            "y.vel": 0.0,
-            "theta.vel": 0.0,
-        }
+    # Build action dict
+    action = {
+        "arm_shoulder_pan.pos": request.arm_shoulder_pan,
+        "arm_shoulder_lift.pos": request.arm_shoulder_lift,
+        "arm_elbow_flex.pos": request.arm_elbow_flex,
+        "arm_wrist_flex.pos": request.arm_wrist_flex,
+        "arm_wrist_roll.pos": request.arm_wrist_roll,
+        "arm_gripper.pos": request.arm_gripper,
+        "x.vel": 0.0,
+        "y.vel": 0.0,
+        "theta.vel": 0.0,
+    }
 
-        action_sent = robot.send_action(action)
-        return ActionResponse(success=True, action_sent=action_sent)
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to set arm position: {str(e)}")
+    action_sent = await coalescer.actions.send(action)
+    return ORJSONResponse({"success": True, "action_sent": action_sent})
 
 
 @router.post("/base/velocity", response_model=ActionResponse)
-async def set_base_velocity(request: BaseVelocityRequest, robot: LeKiwi = Depends(get_robot)):
+async def set_base_velocity(
+    request: BaseVelocityRequest,
+    robot: LeKiwi = Depends(get_robot),
+    coalescer: RobotCoalescer = Depends(get_coalescer),
+):
     """Set target velocities for base wheels.
 
     x, y: linear velocities in m/s
@@ -90,42 +107,32 @@ async def set_base_velocity(request: BaseVelocityRequest, robot: LeKiwi = Depend
     if not robot.is_connected:
         raise HTTPException(status_code=503, detail="Robot not connected")
 
-    try:
-        # Get current arm positions
-        observation = robot.get_observation()
-
-        # Build action dict with current arm positions and new base velocities
-        action = {
-            "arm_shoulder_pan.pos": observation["arm_shoulder_pan.pos"],
-            "arm_shoulder_lift.pos": observation["arm_shoulder_lift.pos"],
-            "arm_elbow_flex.pos": observation["arm_elbow_flex.pos"],
-            "arm_wrist_flex.pos": observation["arm_wrist_flex.pos"],
-            "arm_wrist_roll.pos": observation["arm_wrist_roll.pos"],
-            "arm_gripper.pos": observation["arm_gripper.pos"],
-            "x.vel": request.x,
-            "y.vel": request.y,
-            "theta.vel": request.theta,
-        }
+    # Get current arm positions (motor bus only, no camera reads)
+    arm_positions = await run_in_threadpool(robot.get_arm_positions)
 
-        action_sent = robot.send_action(action)
-        return ActionResponse(success=True, action_sent=action_sent)
+    # Build action dict with current arm positions and new base velocities
+    action = {
+        **arm_positions,
+        "x.vel": request.x,
+        "y.vel": request.y,
+        "theta.vel": request.theta,
+    }
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to set base velocity: {str(e)}")
+    action_sent = await coalescer.actions.send(action)
+    return ORJSONResponse({"success": True, "action_sent": action_sent})
 
 
 @router.post("/stop", response_model=ActionResponse)
-async def stop_motors(robot: LeKiwi = Depends(get_robot)):
+async def stop_motors(
+    robot: LeKiwi = Depends(get_robot), coalescer: RobotCoalescer = Depends(get_coalescer)
+):
     """Emergency stop - stops base motors immediately.
 
-    Arm motors maintain their current position.
+    Arm motors maintain their current position. Commands still queued are dropped, and the stop is
+    written right after any command already on the bus, so no earlier command can override it.
     """
     if not robot.is_connected:
         raise HTTPException(status_code=503, detail="Robot not connected")
 
-    try:
-        robot.stop_base()
-        return ActionResponse(success=True, action_sent={"base": "stopped"})
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to stop motors: {str(e)}")
+    action_sent = await coalescer.actions.stop()
+    return ORJSONResponse({"success": True, "action_sent": action_sent})
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/robot", tags=["robot"])
 
 
 @router.post("/connect")
-async def connect_robot(robot: LeKiwi = Depends(get_robot)):
+def connect_robot(robot: LeKiwi = Depends(get_robot)):
     """Connect to the robot hardware.
 
     This initializes the motor bus and cameras.
@@ -32,7 +32,7 @@ async def connect_robot(robot: LeKiwi = Depends(get_robot)):
 
 
 @router.post("/disconnect")
-async def disconnect_robot(robot: LeKiwi = Depends(get_robot)):
+def disconnect_robot(robot: LeKiwi = Depends(get_robot)):
     """Disconnect from the robot hardware.
 
     This stops all motors and closes connections.
@@ -48,7 +48,7 @@ async def disconnect_robot(robot: LeKiwi = Depends(get_robot)):
 
 
 @router.post("/calibrate", response_model=CalibrationResponse)
-async def calibrate_robot(robot: LeKiwi = Depends(get_robot)):
+def calibrate_robot(robot: LeKiwi = Depends(get_robot)):
     """Run robot calibration.
 
     WARNING: This is an interactive process that requires user input.
@@ -0,0 +1,88 @@
+# ABOUTME: WebSocket push endpoints for motor telemetry and camera frames
+# ABOUTME: Streams robot state and JPEG frames over one persistent connection instead of HTTP polling
+
+import asyncio
+import logging
+import time
+
+import orjson
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+
+from lekiwi_control.api.coalescing import RobotCoalescer
+from lekiwi_control.api.dependencies import get_coalescer, get_robot
+from lekiwi_control.api.routes.motors import motors_state_payload
+from lekiwi_control.api.streaming import get_streamer
+from lekiwi_control.robot.lekiwi import LeKiwi
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/ws", tags=["telemetry"])
+
+
+@router.websocket("/telemetry")
+async def telemetry(
+    websocket: WebSocket,
+    rate: float = Query(30.0, gt=0, le=100, description="Messages per second"),
+    robot: LeKiwi = Depends(get_robot),
+    coalescer: RobotCoalescer = Depends(get_coalescer),
+):
+    """Push motor state as JSON messages at `rate` Hz.
+
+    Each binary message has the same shape as the `GET /motors/state` response.
+    """
+    await websocket.accept()
+    if not robot.is_connected:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Robot not connected")
+        return
+
+    period = 1.0 / rate
+    motors_state = coalescer.motors_state
+    try:
+        while True:
+            start = time.perf_counter()
+            state = await motors_state.get()
+            payload = orjson.dumps(motors_state_payload(state), option=orjson.OPT_SERIALIZE_NUMPY)
+            await websocket.send_bytes(payload)
+            await asyncio.sleep(max(0.0, period - (time.perf_counter() - start)))
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        # Close reasons are capped at 123 bytes, so the details only go to the server log
+        logger.warning(f"Telemetry stream stopped: {e}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="Failed to read motor state")
+
+
+@router.websocket("/camera/{camera_id}")
+async def camera_frames(
+    websocket: WebSocket,
+    camera_id: str,
+    w: int | None = Query(None, gt=0, description="Downscale frames to this width (keeps aspect ratio)"),
+    robot: LeKiwi = Depends(get_robot),
+):
+    """Push JPEG frames from the specified camera as binary messages.
+
+    Frames come from the same shared producer as the MJPEG stream endpoint.
+    """
+    await websocket.accept()
+    if not robot.is_connected:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Robot not connected")
+        return
+    if camera_id not in robot.cameras:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Camera not found")
+        return
+
+    streamer = get_streamer(camera_id, robot.cameras[camera_id], w)
+    cache = await streamer.subscribe()
+    try:
+        seq = 0
+        while True:
+            item = await cache.wait_next(seq)
+            if item is None:
+                await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="Camera stream stopped")
+                break
+            seq, jpeg = item
+            await websocket.send_bytes(jpeg)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        streamer.unsubscribe()
@@ -0,0 +1,175 @@
+# ABOUTME: Shared MJPEG frame producers for camera streaming endpoints
+# ABOUTME: One background task per camera and output width encodes frames that every subscriber reads
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import cv2
+from fastapi.concurrency import run_in_threadpool
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from lekiwi_control.cameras.camera import Camera
+from lekiwi_control.cameras.utils import encode_jpeg
+
+logger = logging.getLogger(__name__)
+
+STREAM_FPS = 30
+STREAM_JPEG_QUALITY = 85
+
+MJPEG_MEDIA_TYPE = "multipart/x-mixed-replace; boundary=frame"
+_MJPEG_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_TAIL = b"\r\n"
+
+
+class LatestFrameCache:
+    """Single-slot cache holding the most recent encoded JPEG of a camera.
+
+    Subscribers wait for a sequence number newer than the one they last saw, so slow viewers skip
+    frames instead of queueing them.
+    """
+
+    def __init__(self):
+        self.frame: bytes | None = None
+        self.seq = 0
+        self.closed = False
+        self._event = asyncio.Event()
+        self._part: bytes = b""
+        self._part_seq = 0
+
+    def publish(self, frame: bytes) -> None:
+        """Store a new frame and wake up every waiting subscriber."""
+        self.frame = frame
+        self.seq += 1
+        self._notify()
+
+    def mjpeg_part(self) -> bytes:
+        """Return the current frame framed as one MJPEG multipart part.
+
+        The part is built once per frame and shared by every MJPEG subscriber.
+        """
+        if self._part_seq != self.seq:
+            self._part = b"".join((_MJPEG_HEADER, self.frame, _MJPEG_TAIL))
+            self._part_seq = self.seq
+        return self._part
+
+    def close(self) -> None:
+        """Mark the cache as closed so waiting subscribers end their streams."""
+        self.closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        self._event.set()
+        self._event = asyncio.Event()
+
+    async def wait_next(self, last_seq: int) -> tuple[int, bytes] | None:
+        """Wait for a frame newer than `last_seq`.
+
+        Returns:
+            The new sequence number and frame, or None once the cache is closed.
+        """
+        while self.seq == last_seq and not self.closed:
+            await self._event.wait()
+        if self.closed:
+            return None
+        return self.seq, self.frame
+
+
+class CameraStreamer:
+    """Reads and encodes frames from one camera on behalf of all its stream subscribers.
+
+    The producer task only runs while at least one subscriber is attached, and each run publishes
+    into its own cache so a stopping producer can never close the cache of its successor. When
+    `width` is set, frames wider than it are downscaled (keeping aspect ratio) before encoding.
+    """
+
+    def __init__(self, camera: Camera, width: int | None = None, fps: float = STREAM_FPS):
+        self.camera = camera
+        self.width = width
+        self.fps = fps
+        self.cache = LatestFrameCache()
+        self.subscribers = 0
+        self._task: asyncio.Task | None = None
+        self._stopping: asyncio.Task | None = None
+
+    async def subscribe(self) -> LatestFrameCache:
+        """Attach a subscriber, starting a producer if none is running, and return its cache."""
+        # Counted before waiting so the stopping producer does not evict this streamer meanwhile
+        self.subscribers += 1
+        try:
+            while self._task is None or self._task.done():
+                stopping = self._stopping
+                if stopping is not None and not stopping.done():
+                    # Let the cancelled producer finish before a new one reads the camera
+                    await asyncio.wait({stopping})
+                    continue
+                self.cache = LatestFrameCache()
+                self._task = asyncio.create_task(self._produce(self.cache))
+        except BaseException:
+            self.subscribers -= 1
+            raise
+        return self.cache
+
+    def unsubscribe(self) -> None:
+        self.subscribers -= 1
+        if self.subscribers <= 0 and self._task is not None:
+            self._task.cancel()
+            self._stopping, self._task = self._task, None
+            self._stopping.add_done_callback(self._release)
+
+    def _release(self, _task: asyncio.Task) -> None:
+        # Forget the streamer once its producer has stopped, unless a new subscriber came back meanwhile
+        if self._task is None and self.subscribers <= 0:
+            _discard_streamer(self)
+
+    def _encode(self, frame: NDArray[Any]) -> bytes | memoryview | None:
+        h, w = frame.shape[:2]
+        if self.width is not None and w > self.width:
+            height = max(1, round(h * self.width / w))
+            frame = cv2.resize(frame, (self.width, height), interpolation=cv2.INTER_AREA)
+        return encode_jpeg(frame, STREAM_JPEG_QUALITY)
+
+    async def _produce(self, cache: LatestFrameCache) -> None:
+        period = 1.0 / self.fps
+        try:
+            while True:
+                start = time.perf_counter()
+                frame = await run_in_threadpool(self.camera.async_read)
+                jpeg = await run_in_threadpool(self._encode, frame)
+                if jpeg is not None:
+                    # One copy per frame here, shared by every subscriber
+                    cache.publish(bytes(jpeg))
+
+                elapsed = time.perf_counter() - start
+                await asyncio.sleep(max(0.0, period - elapsed))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Stopping stream for {self.camera}: {e}")
+        finally:
+            cache.close()
+
+
+# Only streamers with subscribers (or a producer still stopping) are kept, so arbitrary client
+# widths cannot accumulate
+_streamers: dict[tuple[str, int | None], CameraStreamer] = {}
+
+
+def get_streamer(camera_id: str, camera: Camera, width: int | None = None) -> CameraStreamer:
+    """Return the shared streamer for a camera and output width, creating it on first use.
+
+    Streamers are dropped again once their last subscriber has left.
+    """
+    key = (camera_id, width)
+    streamer = _streamers.get(key)
+    if streamer is None or streamer.camera is not camera:
+        streamer = CameraStreamer(camera, width)
+        _streamers[key] = streamer
+    return streamer
+
+
+def _discard_streamer(streamer: CameraStreamer) -> None:
+    for key, registered in list(_streamers.items()):
+        if registered is streamer:
+            del _streamers[key]
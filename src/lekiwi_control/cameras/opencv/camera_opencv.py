@@ -208,6 +208,10 @@ class OpenCVCamera(Camera):
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
+        # Keep a single driver buffer so reads return the newest frame instead of a stale backlog.
+        # Not every backend supports this property, so failure is ignored.
+        self.videocapture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
         default_width = int(round(self.videocapture.get(cv2.CAP_PROP_FRAME_WIDTH)))
         default_height = int(round(self.videocapture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
 
@@ -365,7 +369,9 @@ class OpenCVCamera(Camera):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        start_time = time.perf_counter()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            start_time = time.perf_counter()
 
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
@@ -377,8 +383,9 @@ class OpenCVCamera(Camera):
 
         processed_frame = self._postprocess_image(frame, color_mode)
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+        if debug:
+            read_duration_ms = (time.perf_counter() - start_time) * 1e3
+            logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return processed_frame
 
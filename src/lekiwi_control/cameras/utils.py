@@ -14,11 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import platform
+from functools import cache
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
 
 from .camera import Camera
 from .configs import CameraConfig, Cv2Rotation
 
+logger = logging.getLogger(__name__)
+
 
 def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[str, Camera]:
     """Create camera instances from configuration dict.
@@ -61,5 +68,50 @@ def get_cv2_backend() -> int:
         return int(cv2.CAP_MSMF)  # Use MSMF for Windows instead of AVFOUNDATION
     # elif platform.system() == "Darwin":  # macOS
     #     return cv2.CAP_AVFOUNDATION
-    else:  # Linux and others
+    elif platform.system() == "Linux":
+        return int(cv2.CAP_V4L2)  # Memory-mapped V4L2 capture, no GStreamer/FFmpeg indirection
+    else:
         return int(cv2.CAP_ANY)
+
+
+@cache
+def _get_turbojpeg() -> Any | None:
+    """Return a shared TurboJPEG encoder, or None if PyTurboJPEG/libjpeg-turbo is unavailable."""
+    try:
+        from turbojpeg import TurboJPEG
+    except ImportError:
+        return None
+
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        logger.warning(f"libjpeg-turbo could not be loaded, falling back to OpenCV JPEG encoding: {e}")
+        return None
+
+
+def encode_jpeg(frame: NDArray[Any], quality: int) -> bytes | memoryview | None:
+    """Encode a 3-channel frame as JPEG.
+
+    Uses libjpeg-turbo's SIMD encoder through PyTurboJPEG when it is installed, and OpenCV's
+    `imencode` otherwise. Pixels are interpreted as BGR in both cases.
+
+    Args:
+        frame: Image as a (height, width, 3) uint8 array.
+        quality: JPEG quality (0-100).
+
+    Returns:
+        The encoded JPEG as a bytes-like object, or None if encoding failed. The OpenCV path
+        returns a flat memoryview over the encoder's output array to avoid copying it.
+    """
+    turbojpeg = _get_turbojpeg()
+    if turbojpeg is not None:
+        from turbojpeg import TJPF_BGR
+
+        return turbojpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+
+    import cv2
+
+    ret, buffer = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+    if not ret:
+        return None
+    return memoryview(buffer.reshape(-1))
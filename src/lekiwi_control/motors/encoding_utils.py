@@ -3,6 +3,8 @@
 # ABOUTME: Encoding utilities for motor communication
 # ABOUTME: Provides sign-magnitude conversion for motor values
 
+import numpy as np
+
 
 def encode_sign_magnitude(value: int | float, sign_bit: int) -> int:
     """
@@ -57,3 +59,47 @@ def decode_sign_magnitude(value: int, sign_bit: int) -> int:
 
     # Return signed value
     return -magnitude if is_negative else magnitude
+
+
+def encode_sign_magnitude_array(values: np.ndarray, sign_bit: int) -> np.ndarray:
+    """
+    Encode an array of signed values into sign-magnitude representation.
+
+    Vectorized counterpart of `encode_sign_magnitude` for batched motor writes.
+
+    Args:
+        values: The signed values to encode
+        sign_bit: The bit position for the sign (0-indexed from LSB)
+
+    Returns:
+        The encoded unsigned integer values (int64)
+
+    Examples:
+        >>> encode_sign_magnitude_array(np.array([-100, 100]), 15)
+        array([32868,   100])
+    """
+    values = np.asarray(values)
+    magnitude = np.abs(values).astype(np.int64)
+    return np.where(values < 0, magnitude | (1 << sign_bit), magnitude)
+
+
+def decode_sign_magnitude_array(values: np.ndarray, sign_bit: int) -> np.ndarray:
+    """
+    Decode an array of sign-magnitude encoded values into signed integers.
+
+    Vectorized counterpart of `decode_sign_magnitude` for batched motor reads.
+
+    Args:
+        values: The unsigned encoded values
+        sign_bit: The bit position for the sign (0-indexed from LSB)
+
+    Returns:
+        The decoded signed integer values (int64)
+
+    Examples:
+        >>> decode_sign_magnitude_array(np.array([32868, 100]), 15)
+        array([-100,  100])
+    """
+    values = np.asarray(values, dtype=np.int64)
+    magnitude = values & ((1 << sign_bit) - 1)
+    return np.where((values >> sign_bit) & 1, -magnitude, magnitude)
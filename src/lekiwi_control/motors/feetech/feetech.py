@@ -17,9 +17,18 @@ from copy import deepcopy
 from enum import Enum
 from pprint import pformat
 
-from lekiwi_control.motors.encoding_utils import decode_sign_magnitude, encode_sign_magnitude
-
-from ..motors_bus import Motor, MotorCalibration, MotorsBus, NameOrID, Value, get_address
+from lekiwi_control.motors.encoding_utils import decode_sign_magnitude_array, encode_sign_magnitude_array
+from lekiwi_control.utils.errors import DeviceNotConnectedError
+
+from ..motors_bus import (
+    Motor,
+    MotorCalibration,
+    MotorsBus,
+    NameOrID,
+    Value,
+    assert_same_address,
+    get_address,
+)
 from .tables import (
     FIRMWARE_MAJOR_VERSION,
     FIRMWARE_MINOR_VERSION,
@@ -312,29 +321,119 @@ class FeetechMotorsBus(MotorsBus):
             self.write("Torque_Enable", motor, TorqueMode.ENABLED.value, num_retry=num_retry)
             self.write("Lock", motor, 1, num_retry=num_retry)
 
-    def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
+    def _group_ids_by_sign_bit(self, data_name: str, motor_ids) -> dict[int, list[int]]:
+        groups: dict[int, list[int]] = {}
+        for id_ in motor_ids:
             model = self._id_to_model(id_)
             encoding_table = self.model_encoding_table.get(model)
             if encoding_table and data_name in encoding_table:
-                sign_bit = encoding_table[data_name]
-                ids_values[id_] = encode_sign_magnitude(ids_values[id_], sign_bit)
+                groups.setdefault(encoding_table[data_name], []).append(id_)
+
+        return groups
+
+    def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
+        for sign_bit, ids in self._group_ids_by_sign_bit(data_name, ids_values).items():
+            encoded = encode_sign_magnitude_array([ids_values[id_] for id_ in ids], sign_bit)
+            ids_values.update(zip(ids, encoded.tolist(), strict=True))
 
         return ids_values
 
     def _decode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
-        for id_ in ids_values:
-            model = self._id_to_model(id_)
-            encoding_table = self.model_encoding_table.get(model)
-            if encoding_table and data_name in encoding_table:
-                sign_bit = encoding_table[data_name]
-                ids_values[id_] = decode_sign_magnitude(ids_values[id_], sign_bit)
+        for sign_bit, ids in self._group_ids_by_sign_bit(data_name, ids_values).items():
+            decoded = decode_sign_magnitude_array([ids_values[id_] for id_ in ids], sign_bit)
+            ids_values.update(zip(ids, decoded.tolist(), strict=True))
 
         return ids_values
 
     def _split_into_byte_chunks(self, value: int, length: int) -> list[int]:
         return _split_into_byte_chunks(value, length)
 
+    def sync_write_multi(
+        self,
+        writes: dict[str, dict[str, Value]],
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> None:
+        """Write several registers, each on its own set of motors, in one serial transfer.
+
+        Every register still gets its own SYNC_WRITE packet, so the registers don't need to be
+        adjacent, but the packets are concatenated and handed to the port with a single write.
+        Like :pymeth:`sync_write`, no status packet is expected back.
+
+        Args:
+            writes (dict[str, dict[str, Value]]): Mapping *register name → motor name → value*.
+                Registers with no values are skipped.
+            normalize (bool, optional): If `True` (default) convert values from the user range to raw units.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+
+        packets = bytearray()
+        for data_name, values in writes.items():
+            if not values:
+                continue
+
+            ids_values = self._get_ids_values_dict(values)
+            models = [self._id_to_model(id_) for id_ in ids_values]
+            if self._has_different_ctrl_tables:
+                assert_same_address(self.model_ctrl_table, models, data_name)
+
+            addr, length = get_address(self.model_ctrl_table, models[0], data_name)
+
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._unnormalize(ids_values)
+
+            ids_values = self._encode_sign(data_name, ids_values)
+            packets += self._sync_write_packet(addr, length, ids_values)
+
+        if not packets:
+            return
+
+        err_msg = f"Failed to sync write {list(writes)} after {num_retry + 1} tries."
+        for n_try in range(1 + num_retry):
+            comm = self._write_packets(packets)
+            if self._is_comm_success(comm):
+                break
+            logger.debug(
+                f"Failed to sync write {list(writes)} ({n_try=}): " + self.packet_handler.getTxRxResult(comm)
+            )
+
+        if not self._is_comm_success(comm):
+            raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
+
+    def _sync_write_packet(self, addr: int, length: int, ids_values: dict[int, int]) -> bytes:
+        """Build a complete SYNC_WRITE instruction packet (header and checksum included)."""
+        import scservo_sdk as scs
+
+        params = [addr, length]
+        for id_, value in ids_values.items():
+            params.append(id_)
+            params.extend(self._serialize_data(value, length))
+
+        body = [scs.BROADCAST_ID, len(params) + 2, scs.INST_SYNC_WRITE, *params]
+        checksum = ~sum(body) & 0xFF
+        return bytes([0xFF, 0xFF, *body, checksum])
+
+    def _write_packets(self, packets: bytes) -> int:
+        """Send pre-built instruction packets that expect no reply with one port write."""
+        import scservo_sdk as scs
+
+        if self.port_handler.is_using:
+            return scs.COMM_PORT_BUSY
+
+        self.port_handler.is_using = True
+        try:
+            self.port_handler.clearPort()
+            written = self.port_handler.writePort(packets)
+        finally:
+            self.port_handler.is_using = False
+
+        return scs.COMM_SUCCESS if written == len(packets) else scs.COMM_TX_FAIL
+
     def _broadcast_ping(self) -> tuple[dict[int, int], int]:
         import scservo_sdk as scs
 
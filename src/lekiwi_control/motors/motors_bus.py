@@ -33,7 +33,7 @@ from deepdiff import DeepDiff
 from tqdm import tqdm
 
 from lekiwi_control.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
-from lekiwi_control.utils.terminal_utils import enter_pressed, move_cursor_up
+from lekiwi_control.utils.terminal_utils import enter_pressed, move_cursor_up, raw_stdin
 
 NameOrID: TypeAlias = str | int
 Value: TypeAlias = int | float
@@ -331,13 +331,13 @@ class MotorsBus(abc.ABC):
         else:
             raise TypeError(f"'{motor}' should be int, str.")
 
-    def _get_motors_list(self, motors: str | list[str] | None) -> list[str]:
+    def _get_motors_list(self, motors: str | list[str] | tuple[str, ...] | None) -> list[str]:
         if motors is None:
             return list(self.motors)
         elif isinstance(motors, str):
             return [motors]
-        elif isinstance(motors, list):
-            return motors.copy()
+        elif isinstance(motors, (list, tuple)):
+            return list(motors)
         else:
             raise TypeError(motors)
 
@@ -743,23 +743,24 @@ class MotorsBus(abc.ABC):
         maxes = start_positions.copy()
 
         user_pressed_enter = False
-        while not user_pressed_enter:
-            positions = self.sync_read("Present_Position", motors, normalize=False)
-            mins = {motor: min(positions[motor], min_) for motor, min_ in mins.items()}
-            maxes = {motor: max(positions[motor], max_) for motor, max_ in maxes.items()}
+        with raw_stdin():
+            while not user_pressed_enter:
+                positions = self.sync_read("Present_Position", motors, normalize=False)
+                mins = {motor: min(positions[motor], min_) for motor, min_ in mins.items()}
+                maxes = {motor: max(positions[motor], max_) for motor, max_ in maxes.items()}
 
-            if display_values:
-                print("\n-------------------------------------------")
-                print(f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}")
-                for motor in motors:
-                    print(f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}")
+                if display_values:
+                    print("\n-------------------------------------------")
+                    print(f"{'NAME':<15} | {'MIN':>6} | {'POS':>6} | {'MAX':>6}")
+                    for motor in motors:
+                        print(f"{motor:<15} | {mins[motor]:>6} | {positions[motor]:>6} | {maxes[motor]:>6}")
 
-            if enter_pressed():
-                user_pressed_enter = True
+                if enter_pressed():
+                    user_pressed_enter = True
 
-            if display_values and not user_pressed_enter:
-                # Move cursor up to overwrite the previous output
-                move_cursor_up(len(motors) + 3)
+                if display_values and not user_pressed_enter:
+                    # Move cursor up to overwrite the previous output
+                    move_cursor_up(len(motors) + 3)
 
         same_min_max = [motor for motor in motors if mins[motor] == maxes[motor]]
         if same_min_max:
@@ -1092,6 +1093,67 @@ class MotorsBus(abc.ABC):
 
         return {self._id_to_name(id_): value for id_, value in ids_values.items()}
 
+    def sync_read_multi(
+        self,
+        reads: dict[str, list[str] | tuple[str, ...]],
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> dict[str, dict[str, Value]]:
+        """Read several registers, each from its own set of motors, in a single sync read.
+
+        One SYNC_READ packet covers the contiguous address span of all requested registers on the
+        union of the motors, and each register is then extracted for the motors it was requested
+        for. With neighbouring registers (e.g. `Present_Position` and `Present_Velocity`) this
+        costs one bus round-trip instead of one per register.
+
+        Args:
+            reads (dict[str, list[str] | tuple[str, ...]]): Mapping *register name → motors*.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*, with motors in
+            the requested order.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+
+        self._assert_protocol_is_compatible("sync_read")
+
+        layout = {}
+        all_ids = {}
+        for data_name, motors in reads.items():
+            names = self._get_motors_list(motors)
+            ids = [self.motors[motor].id for motor in names]
+            models = [self.motors[motor].model for motor in names]
+            if self._has_different_ctrl_tables:
+                assert_same_address(self.model_ctrl_table, models, data_name)
+            addr, length = get_address(self.model_ctrl_table, models[0], data_name)
+            layout[data_name] = (addr, length, ids)
+            all_ids.update(dict.fromkeys(ids))
+
+        start = min(addr for addr, _, _ in layout.values())
+        end = max(addr + length for addr, length, _ in layout.values())
+        motor_ids = list(all_ids)
+
+        err_msg = f"Failed to sync read {list(reads)} on ids={motor_ids} after {num_retry + 1} tries."
+        self._sync_read_packet(
+            start, end - start, motor_ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
+        )
+
+        results = {}
+        for data_name, (addr, length, ids) in layout.items():
+            ids_values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in ids}
+            ids_values = self._decode_sign(data_name, ids_values)
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._normalize(ids_values)
+            results[data_name] = {self._id_to_name(id_): value for id_, value in ids_values.items()}
+
+        return results
+
     def _sync_read(
         self,
         addr: int,
@@ -1102,6 +1164,23 @@ class MotorsBus(abc.ABC):
         raise_on_error: bool = True,
         err_msg: str = "",
     ) -> tuple[dict[int, int], int]:
+        comm = self._sync_read_packet(
+            addr, length, motor_ids, num_retry=num_retry, raise_on_error=raise_on_error, err_msg=err_msg
+        )
+        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+        return values, comm
+
+    def _sync_read_packet(
+        self,
+        addr: int,
+        length: int,
+        motor_ids: list[int],
+        *,
+        num_retry: int = 0,
+        raise_on_error: bool = True,
+        err_msg: str = "",
+    ) -> int:
+        """Run one sync read transaction, leaving the received bytes in `self.sync_reader`."""
         self._setup_sync_reader(motor_ids, addr, length)
         for n_try in range(1 + num_retry):
             comm = self.sync_reader.txRxPacket()
@@ -1115,8 +1194,7 @@ class MotorsBus(abc.ABC):
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
 
-        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
-        return values, comm
+        return comm
 
     def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
         self.sync_reader.clearParam()
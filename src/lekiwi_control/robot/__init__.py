@@ -1,7 +1,15 @@
 # ABOUTME: LeKiwi robot implementation package
-# ABOUTME: Provides main LeKiwi robot class
+# ABOUTME: Provides main LeKiwi robot class and its domain exceptions
 
 from .lekiwi import LeKiwi
 from .config import LeKiwiConfig
+from .errors import CameraError, MotorBusError, RobotError, RobotNotConnectedError
 
-__all__ = ["LeKiwi", "LeKiwiConfig"]
+__all__ = [
+    "CameraError",
+    "LeKiwi",
+    "LeKiwiConfig",
+    "MotorBusError",
+    "RobotError",
+    "RobotNotConnectedError",
+]
@@ -17,6 +17,14 @@ class LeKiwiConfig:
     # Safety: limit relative movement distance per command
     max_relative_target: float | dict[str, float] | None = None
 
+    # Arm positions read less than this many seconds ago are reused for the max_relative_target
+    # check instead of issuing another bus read
+    present_pos_max_age: float = 0.02
+
+    # Arm goals within this distance (in normalized units) of the goal last written are not rewritten;
+    # 0 only skips goals identical to the previous ones
+    goal_pos_deadband: float = 0.0
+
     # Torque management
     disable_torque_on_disconnect: bool = True
 
@@ -26,11 +34,12 @@ class LeKiwiConfig:
     # Camera configuration
     cameras: dict[str, CameraConfig] = field(
         default_factory=lambda: {
+            # MJPG keeps USB bandwidth and driver-side copies low; falls back to the default format
             "front": OpenCVCameraConfig(
-                index_or_path="/dev/video0", rotation=Cv2Rotation.ROTATE_180
+                index_or_path="/dev/video0", rotation=Cv2Rotation.ROTATE_180, fourcc="MJPG"
             ),
             "wrist": OpenCVCameraConfig(
-                index_or_path="/dev/video2", rotation=Cv2Rotation.ROTATE_90
+                index_or_path="/dev/video2", rotation=Cv2Rotation.ROTATE_90, fourcc="MJPG"
             ),
         }
     )
@@ -0,0 +1,20 @@
+# ABOUTME: Domain exceptions raised by the LeKiwi robot
+# ABOUTME: The API maps these to HTTP status codes with application-level exception handlers
+
+from lekiwi_control.utils import DeviceNotConnectedError
+
+
+class RobotError(Exception):
+    """Base class for errors raised while operating the robot."""
+
+
+class RobotNotConnectedError(RobotError, DeviceNotConnectedError):
+    """Raised when an operation needs the robot hardware but it is not connected."""
+
+
+class MotorBusError(RobotError):
+    """Raised when a motor bus transaction fails."""
+
+
+class CameraError(RobotError):
+    """Raised when a camera frame cannot be captured."""
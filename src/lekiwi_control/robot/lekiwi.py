@@ -1,24 +1,118 @@
 # ABOUTME: LeKiwi robot class - main interface for controlling the LeKiwi robot
 # ABOUTME: Manages motors (arm + omnidirectional base) and cameras (front + wrist)
 
-import json
+import asyncio
 import logging
+import sys
+import threading
 import time
-from functools import cached_property
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import cached_property, lru_cache
 from itertools import chain
 from pathlib import Path
 from typing import Any
 
 import numpy as np
+import orjson
 
 from lekiwi_control.cameras import make_cameras_from_configs
 from lekiwi_control.motors import Motor, MotorCalibration, MotorNormMode
 from lekiwi_control.motors.feetech import FeetechMotorsBus, OperatingMode
 from lekiwi_control.robot.config import LeKiwiConfig
+from lekiwi_control.robot.errors import CameraError, MotorBusError, RobotNotConnectedError
 from lekiwi_control.utils import DeviceAlreadyConnectedError, DeviceNotConnectedError
+from lekiwi_control.utils.terminal_utils import set_serial_low_latency
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Base geometry (m) and wheel mounting angles (deg, before the -90° offset)
+WHEEL_RADIUS = 0.05
+BASE_RADIUS = 0.125
+WHEEL_ANGLES_DEG = (240, 0, 120)
+
+_STEPS_PER_DEG = 4096.0 / 360.0
+_DEG2RAD = np.pi / 180.0
+_RAD2DEG = 180.0 / np.pi
+
+
+def _inv3(m: np.ndarray) -> np.ndarray:
+    """Invert a 3x3 matrix with the adjugate formula."""
+    (a, b, c), (d, e, f), (g, h, i) = m.tolist()
+    adj = np.array(
+        [
+            [e * i - f * h, c * h - b * i, b * f - c * e],
+            [f * g - d * i, a * i - c * g, c * d - a * f],
+            [d * h - e * g, b * g - a * h, a * e - b * d],
+        ]
+    )
+    det = a * adj[0, 0] + b * adj[1, 0] + c * adj[2, 0]
+    if abs(det) < 1e-12:
+        raise ValueError("Kinematics matrix is singular")
+    return adj / det
+
+
+def _jit(func: Callable) -> Callable:
+    """Compile `func` with numba when it is installed, otherwise run it as plain Python."""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def _body_to_wheel_raw_core(
+    x: float, y: float, theta: float, m_raw: tuple[float, ...], max_raw: float
+) -> tuple[int, int, int]:
+    """Map body velocities to raw wheel speeds through the flattened row-major matrix `m_raw`."""
+    left = m_raw[0] * x + m_raw[1] * y + m_raw[2] * theta
+    back = m_raw[3] * x + m_raw[4] * y + m_raw[5] * theta
+    right = m_raw[6] * x + m_raw[7] * y + m_raw[8] * theta
+
+    # Scale if exceeds max
+    peak = max(abs(left), abs(back), abs(right))
+    if peak > max_raw:
+        scale = max_raw / peak
+        left *= scale
+        back *= scale
+        right *= scale
+
+    # Round half to even, capped to the signed 16-bit range
+    return (
+        min(max(round(left), -0x8000), 0x7FFF),
+        min(max(round(back), -0x8000), 0x7FFF),
+        min(max(round(right), -0x8000), 0x7FFF),
+    )
+
+
+@_jit
+def _wheel_raw_to_body_core(
+    left: float, back: float, right: float, m_inv: tuple[float, ...]
+) -> tuple[float, float, float]:
+    """Map raw wheel speeds to body velocities (m/s, m/s, deg/s) through the flattened inverse matrix."""
+    # Convert raw to deg/s, then to rad/s and then to linear speeds
+    left = left / _STEPS_PER_DEG * _DEG2RAD * WHEEL_RADIUS
+    back = back / _STEPS_PER_DEG * _DEG2RAD * WHEEL_RADIUS
+    right = right / _STEPS_PER_DEG * _DEG2RAD * WHEEL_RADIUS
+
+    x = m_inv[0] * left + m_inv[1] * back + m_inv[2] * right
+    y = m_inv[3] * left + m_inv[4] * back + m_inv[5] * right
+    theta_rad = m_inv[6] * left + m_inv[7] * back + m_inv[8] * right
+    return x, y, theta_rad * _RAD2DEG
+
+
+@lru_cache(maxsize=8)
+def _load_calibration_cached(path: str, mtime_ns: int) -> dict[str, MotorCalibration]:
+    """Parse a calibration file; the modification time in the key invalidates stale entries."""
+    data = orjson.loads(Path(path).read_bytes())
+    return {name: MotorCalibration(**cal_data) for name, cal_data in data.items()}
+
 
 class LeKiwi:
     """LeKiwi robot with mobile omnidirectional base and manipulator arm.
@@ -29,6 +123,8 @@ class LeKiwi:
     - 2 cameras (front and wrist)
     """
 
+    _BASE_VEL_KEYS = ("x.vel", "y.vel", "theta.vel")
+
     def __init__(self, config: LeKiwiConfig):
         self.config = config
         norm_mode_body = MotorNormMode.DEGREES if config.use_degrees else MotorNormMode.RANGE_M100_100
@@ -51,7 +147,57 @@ class LeKiwi:
         )
         self.arm_motors = [motor for motor in self.bus.motors if motor.startswith("arm")]
         self.base_motors = [motor for motor in self.bus.motors if motor.startswith("base")]
+        # Immutable copies and interned "<motor>.pos" keys used on the read/command hot paths
+        self._arm_motors = tuple(self.arm_motors)
+        self._base_motors = tuple(self.base_motors)
+        self._arm_pos_keys = tuple(sys.intern(name + ".pos") for name in self._arm_motors)
+        self._arm_name_from_poskey = dict(zip(self._arm_pos_keys, self._arm_motors, strict=True))
+        # Zero-velocity command for stop_base, built once instead of on every stop
+        self._base_zero = {"Goal_Velocity": dict.fromkeys(self._base_motors, 0)}
+        self._max_rel_arr = self._build_max_rel_arr(config.max_relative_target)
         self.cameras = make_cameras_from_configs(config.cameras)
+        self._cam_values = tuple(self.cameras.values())
+        # Waits for camera frames in parallel with each other and with the motor bus reads
+        self._cam_pool = ThreadPoolExecutor(
+            max_workers=max(1, len(self.cameras)), thread_name_prefix="lekiwi-camera"
+        )
+
+        # Set once connect() completes and cleared by disconnect(); see is_connected
+        self._connected = False
+
+        # Last arm position read as (perf_counter timestamp, {"<motor>.pos": value})
+        self._last_arm_pos: tuple[float, dict[str, float]] | None = None
+
+        # Serializes bus transactions issued from different threads so packets never interleave;
+        # reentrant because connect() and calibrate() nest other locked methods
+        self._bus_lock = threading.RLock()
+
+        # Last commands known to be in the motors' goal registers, so send_action can skip rewriting them
+        self._last_base_cmd: tuple[float, float, float] | None = None
+        self._last_arm_cmd: dict[str, float] = {}
+
+        # Base kinematics matrix (body velocity -> wheel linear speeds) and its inverse
+        angles = np.radians(np.array(WHEEL_ANGLES_DEG) - 90)
+        self._M = np.array([[np.cos(a), np.sin(a), BASE_RADIUS] for a in angles])
+        self._M_inv = _inv3(self._M)
+        # Same mapping folded into raw wheel step rates, taking theta in deg/s
+        self._M_raw = self._M * (_RAD2DEG / WHEEL_RADIUS * _STEPS_PER_DEG)
+        self._M_raw[:, 2] *= _DEG2RAD
+        # Flattened row-major copies handed to the kinematics cores
+        self._M_raw_flat = tuple(self._M_raw.ravel().tolist())
+        self._M_inv_flat = tuple(self._M_inv.ravel().tolist())
+        if njit is not None:
+            # Compile the cores now rather than on the first command, which runs with the bus lock held
+            _body_to_wheel_raw_core(0.0, 0.0, 0.0, self._M_raw_flat, 3000.0)
+            _wheel_raw_to_body_core(0.0, 0.0, 0.0, self._M_inv_flat)
+
+    def _build_max_rel_arr(self, max_rel: float | dict[str, float] | None) -> np.ndarray | None:
+        """Per-arm-motor relative move caps in `_arm_pos_keys` order, or None when unlimited."""
+        if max_rel is None:
+            return None
+        if isinstance(max_rel, dict):
+            return np.array([max_rel.get(name, np.inf) for name in self._arm_motors], dtype=np.float64)
+        return np.full(len(self._arm_motors), max_rel, dtype=np.float64)
 
     def _load_calibration(self) -> dict[str, MotorCalibration] | None:
         """Load calibration from file if it exists."""
@@ -61,12 +207,10 @@ class LeKiwi:
             return None
 
         try:
-            with open(calibration_file) as f:
-                data = json.load(f)
-
-            calibration = {}
-            for name, cal_data in data.items():
-                calibration[name] = MotorCalibration(**cal_data)
+            mtime_ns = calibration_file.stat().st_mtime_ns
+            cached = _load_calibration_cached(str(calibration_file), mtime_ns)
+            # Copies, so the bus can't mutate the cached entries
+            calibration = {name: replace(cal) for name, cal in cached.items()}
 
             logger.info(f"Loaded calibration from {calibration_file}")
             return calibration
@@ -91,21 +235,29 @@ class LeKiwi:
             }
 
         try:
-            with open(calibration_file, "w") as f:
-                json.dump(data, f, indent=2)
+            calibration_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             logger.info(f"Saved calibration to {calibration_file}")
         except Exception as e:
             logger.error(f"Failed to save calibration to {calibration_file}: {e}")
 
     @property
     def is_connected(self) -> bool:
-        """Check if robot is connected."""
-        return self.bus.is_connected and all(cam.is_connected for cam in self.cameras.values())
+        """Check if robot is connected.
+
+        This trusts the state recorded by connect()/disconnect() so it stays cheap on the control
+        loop; use verify_connected() to query the bus and every camera.
+        """
+        return self._connected
+
+    def verify_connected(self) -> bool:
+        """Check that the motor bus and every camera actually report being connected."""
+        return self.bus.is_connected and all(cam.is_connected for cam in self._cam_values)
 
     @property
     def is_calibrated(self) -> bool:
         """Check if robot is calibrated."""
-        return self.bus.is_calibrated
+        with self._bus_access():
+            return self.bus.is_calibrated
 
     def connect(self, calibrate: bool = True) -> None:
         """Connect to robot hardware.
@@ -117,48 +269,53 @@ class LeKiwi:
         if self.is_connected:
             raise DeviceAlreadyConnectedError("Robot already connected")
 
-        self.bus.connect()
-
-        # If we have calibration loaded from file, write it to motors
-        calibration_from_file = bool(self.bus.calibration)
-        if calibration_from_file:
-            logger.info("Writing calibration from file to motors...")
-            self.bus.disable_torque()
-            self.bus.write_calibration(self.bus.calibration)
-            self.bus.enable_torque()
-            logger.info("Calibration loaded from file and applied successfully")
-
-        # Only run interactive calibration if:
-        # 1. No calibration was loaded from file
-        # 2. Robot is not calibrated
-        # 3. calibrate flag is True
-        if not calibration_from_file and not self.is_calibrated and calibrate:
-            logger.info("Robot not calibrated. Running interactive calibration...")
-            self.calibrate()
-
-        for cam in self.cameras.values():
+        with self._bus_access():
+            self.bus.connect()
+            set_serial_low_latency(self.config.port)
+
+            # If we have calibration loaded from file, write it to motors
+            calibration_from_file = bool(self.bus.calibration)
+            if calibration_from_file:
+                logger.info("Writing calibration from file to motors...")
+                self.bus.disable_torque()
+                self.bus.write_calibration(self.bus.calibration)
+                self.bus.enable_torque()
+                logger.info("Calibration loaded from file and applied successfully")
+
+            # Only run interactive calibration if:
+            # 1. No calibration was loaded from file
+            # 2. Robot is not calibrated
+            # 3. calibrate flag is True
+            if not calibration_from_file and not self.is_calibrated and calibrate:
+                logger.info("Robot not calibrated. Running interactive calibration...")
+                self.calibrate()
+
+        for cam in self._cam_values:
             cam.connect()
 
         self.configure()
+        self._connected = True
         logger.info("LeKiwi robot connected")
 
     def configure(self):
         """Configure motor parameters."""
-        self.bus.disable_torque()
-        self.bus.configure_motors()
+        with self._bus_access():
+            self.bus.disable_torque()
+            self.bus.configure_motors()
 
-        # Configure arm motors (position mode)
-        for name in self.arm_motors:
-            self.bus.write("Operating_Mode", name, OperatingMode.POSITION.value)
-            self.bus.write("P_Coefficient", name, 16)
-            self.bus.write("I_Coefficient", name, 0)
-            self.bus.write("D_Coefficient", name, 32)
+            # Configure arm motors (position mode)
+            for name in self.arm_motors:
+                self.bus.write("Operating_Mode", name, OperatingMode.POSITION.value)
+                self.bus.write("P_Coefficient", name, 16)
+                self.bus.write("I_Coefficient", name, 0)
+                self.bus.write("D_Coefficient", name, 32)
 
-        # Configure base motors (velocity mode)
-        for name in self.base_motors:
-            self.bus.write("Operating_Mode", name, OperatingMode.VELOCITY.value)
+            # Configure base motors (velocity mode)
+            for name in self.base_motors:
+                self.bus.write("Operating_Mode", name, OperatingMode.VELOCITY.value)
 
-        self.bus.enable_torque()
+            self.bus.enable_torque()
+            self._forget_sent_commands()
 
     def calibrate(self) -> None:
         """Run motor calibration procedure.
@@ -167,72 +324,54 @@ class LeKiwi:
         """
         logger.info("Running calibration...")
 
-        motors = self.arm_motors + self.base_motors
+        # Holds the bus for the whole interactive procedure
+        with self._bus_access():
+            self._forget_sent_commands()
 
-        self.bus.disable_torque(self.arm_motors)
-        for name in self.arm_motors:
-            self.bus.write("Operating_Mode", name, OperatingMode.POSITION.value)
+            motors = self.arm_motors + self.base_motors
 
-        input("Move robot to the middle of its range of motion and press ENTER...")
-        homing_offsets = self.bus.set_half_turn_homings(self.arm_motors)
+            self.bus.disable_torque(self.arm_motors)
+            for name in self.arm_motors:
+                self.bus.write("Operating_Mode", name, OperatingMode.POSITION.value)
 
-        homing_offsets.update(dict.fromkeys(self.base_motors, 0))
+            input("Move robot to the middle of its range of motion and press ENTER...")
+            homing_offsets = self.bus.set_half_turn_homings(self.arm_motors)
 
-        full_turn_motor = [
-            motor for motor in motors if any(keyword in motor for keyword in ["wheel", "wrist_roll"])
-        ]
-        unknown_range_motors = [motor for motor in motors if motor not in full_turn_motor]
+            homing_offsets.update(dict.fromkeys(self.base_motors, 0))
 
-        print(
-            f"Move all arm joints except '{full_turn_motor}' sequentially through their "
-            "entire ranges of motion.\nRecording positions. Press ENTER to stop..."
-        )
-        range_mins, range_maxes = self.bus.record_ranges_of_motion(unknown_range_motors)
-        for name in full_turn_motor:
-            range_mins[name] = 0
-            range_maxes[name] = 4095
-
-        calibration = {}
-        for name, motor in self.bus.motors.items():
-            calibration[name] = MotorCalibration(
-                id=motor.id,
-                drive_mode=0,
-                homing_offset=homing_offsets[name],
-                range_min=range_mins[name],
-                range_max=range_maxes[name],
+            full_turn_motor = [
+                motor for motor in motors if any(keyword in motor for keyword in ["wheel", "wrist_roll"])
+            ]
+            unknown_range_motors = [motor for motor in motors if motor not in full_turn_motor]
+
+            print(
+                f"Move all arm joints except '{full_turn_motor}' sequentially through their "
+                "entire ranges of motion.\nRecording positions. Press ENTER to stop..."
             )
+            range_mins, range_maxes = self.bus.record_ranges_of_motion(unknown_range_motors)
+            for name in full_turn_motor:
+                range_mins[name] = 0
+                range_maxes[name] = 4095
 
-        self.bus.write_calibration(calibration)
+            calibration = {}
+            for name, motor in self.bus.motors.items():
+                calibration[name] = MotorCalibration(
+                    id=motor.id,
+                    drive_mode=0,
+                    homing_offset=homing_offsets[name],
+                    range_min=range_mins[name],
+                    range_max=range_maxes[name],
+                )
+
+            self.bus.write_calibration(calibration)
         self._save_calibration(calibration)
         print("Calibration complete")
 
-    @staticmethod
-    def _degps_to_raw(degps: float) -> int:
-        """Convert angular velocity from degrees/sec to raw motor units."""
-        steps_per_deg = 4096.0 / 360.0
-        speed_in_steps = degps * steps_per_deg
-        speed_int = int(round(speed_in_steps))
-        # Cap to signed 16-bit range
-        if speed_int > 0x7FFF:
-            speed_int = 0x7FFF
-        elif speed_int < -0x8000:
-            speed_int = -0x8000
-        return speed_int
-
-    @staticmethod
-    def _raw_to_degps(raw_speed: int) -> float:
-        """Convert raw motor speed to degrees/sec."""
-        steps_per_deg = 4096.0 / 360.0
-        degps = raw_speed / steps_per_deg
-        return degps
-
     def _body_to_wheel_raw(
         self,
         x: float,
         y: float,
         theta: float,
-        wheel_radius: float = 0.05,
-        base_radius: float = 0.125,
         max_raw: int = 3000,
     ) -> dict:
         """Convert body-frame velocities to wheel raw commands.
@@ -241,114 +380,184 @@ class LeKiwi:
             x: Linear velocity in x (m/s)
             y: Linear velocity in y (m/s)
             theta: Rotational velocity (deg/s)
-            wheel_radius: Wheel radius (m)
-            base_radius: Distance from center to wheel (m)
             max_raw: Maximum raw command value
 
         Returns:
             Dict with wheel raw commands
         """
-        # Convert theta to rad/s
-        theta_rad = theta * (np.pi / 180.0)
-        velocity_vector = np.array([x, y, theta_rad])
-
-        # Wheel mounting angles with -90° offset
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-
-        # Compute wheel speeds
-        wheel_linear_speeds = m.dot(velocity_vector)
-        wheel_angular_speeds = wheel_linear_speeds / wheel_radius
-        wheel_degps = wheel_angular_speeds * (180.0 / np.pi)
-
-        # Scale if exceeds max
-        steps_per_deg = 4096.0 / 360.0
-        raw_floats = [abs(degps) * steps_per_deg for degps in wheel_degps]
-        max_raw_computed = max(raw_floats)
-        if max_raw_computed > max_raw:
-            scale = max_raw / max_raw_computed
-            wheel_degps = wheel_degps * scale
-
-        # Convert to raw
-        wheel_raw = [self._degps_to_raw(deg) for deg in wheel_degps]
-
-        return {
-            "base_left_wheel": wheel_raw[0],
-            "base_back_wheel": wheel_raw[1],
-            "base_right_wheel": wheel_raw[2],
-        }
+        wheel_raw = _body_to_wheel_raw_core(
+            float(x), float(y), float(theta), self._M_raw_flat, float(max_raw)
+        )
+        return dict(zip(("base_left_wheel", "base_back_wheel", "base_right_wheel"), wheel_raw))
 
     def _wheel_raw_to_body(
         self,
         left_wheel_speed,
         back_wheel_speed,
         right_wheel_speed,
-        wheel_radius: float = 0.05,
-        base_radius: float = 0.125,
     ) -> dict[str, Any]:
         """Convert wheel raw speeds back to body-frame velocities.
 
         Returns:
             Dict with x.vel, y.vel, theta.vel
         """
-        # Convert raw to deg/s
-        wheel_degps = np.array(
-            [
-                self._raw_to_degps(left_wheel_speed),
-                self._raw_to_degps(back_wheel_speed),
-                self._raw_to_degps(right_wheel_speed),
-            ]
+        x, y, theta = _wheel_raw_to_body_core(
+            float(left_wheel_speed), float(back_wheel_speed), float(right_wheel_speed), self._M_inv_flat
         )
+        return {"x.vel": x, "y.vel": y, "theta.vel": theta}
 
-        # Convert to rad/s and then to linear speeds
-        wheel_radps = wheel_degps * (np.pi / 180.0)
-        wheel_linear_speeds = wheel_radps * wheel_radius
+    def _forget_sent_commands(self) -> None:
+        """Drop the record of written goals so the next send_action writes every command again."""
+        self._last_base_cmd = None
+        self._last_arm_cmd = {}
 
-        # Inverse kinematics
-        angles = np.radians(np.array([240, 0, 120]) - 90)
-        m = np.array([[np.cos(a), np.sin(a), base_radius] for a in angles])
-        m_inv = np.linalg.inv(m)
-        velocity_vector = m_inv.dot(wheel_linear_speeds)
-        x, y, theta_rad = velocity_vector
-        theta = theta_rad * (180.0 / np.pi)
+    @contextmanager
+    def _bus_access(self) -> Iterator[None]:
+        """Hold the bus lock for one group of transactions and report failures as MotorBusError.
 
-        return {"x.vel": x, "y.vel": y, "theta.vel": theta}
+        Connection state errors (not connected / already connected) propagate unchanged.
+        """
+        with self._bus_lock:
+            try:
+                yield
+            except (DeviceNotConnectedError, DeviceAlreadyConnectedError):
+                raise
+            except (ConnectionError, RuntimeError) as e:
+                raise MotorBusError(f"Motor bus error: {e}") from e
+
+    def get_motors_state(self) -> dict[str, Any]:
+        """Get current motor state without capturing camera images.
+
+        Arm positions and base wheel velocities sit in adjacent registers, so both are fetched with
+        a single sync read round-trip.
+
+        Returns:
+            Dict with arm positions (.pos keys) and base velocities (.vel keys)
+        """
+        if not self.is_connected:
+            raise RobotNotConnectedError("Robot not connected")
+
+        start = time.perf_counter()
+        with self._bus_access():
+            reads = self.bus.sync_read_multi(
+                {"Present_Position": self._arm_motors, "Present_Velocity": self._base_motors}
+            )
+            arm_pos = reads["Present_Position"]
+            base_wheel_vel = reads["Present_Velocity"]
+
+            base_vel = self._wheel_raw_to_body(
+                base_wheel_vel["base_left_wheel"],
+                base_wheel_vel["base_back_wheel"],
+                base_wheel_vel["base_right_wheel"],
+            )
+
+        # sync_read returns values in the order the motors were requested
+        arm_state = dict(zip(self._arm_pos_keys, arm_pos.values(), strict=True))
+        self._last_arm_pos = (start, arm_state)
+        state = dict(arm_state)
+        state.update(base_vel)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            dt_ms = (time.perf_counter() - start) * 1e3
+            logger.debug(f"Read motor state: {dt_ms:.1f}ms")
+
+        return state
 
     def get_observation(self) -> dict[str, Any]:
         """Get current robot state (motor positions/velocities and camera images).
 
+        Camera frames are awaited on a small thread pool while the motor bus is read, so the call
+        takes about as long as the slowest of them rather than their sum.
+
         Returns:
             Dict with arm positions, base velocities, and camera images
         """
         if not self.is_connected:
-            raise DeviceNotConnectedError("Robot not connected")
+            raise RobotNotConnectedError("Robot not connected")
 
-        # Read motor states
-        start = time.perf_counter()
-        arm_pos = self.bus.sync_read("Present_Position", self.arm_motors)
-        base_wheel_vel = self.bus.sync_read("Present_Velocity", self.base_motors)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            start = time.perf_counter()
 
-        base_vel = self._wheel_raw_to_body(
-            base_wheel_vel["base_left_wheel"],
-            base_wheel_vel["base_back_wheel"],
-            base_wheel_vel["base_right_wheel"],
-        )
+        # Start waiting for camera frames first so they overlap with the motor bus round-trip
+        frames = {cam_key: self._cam_pool.submit(cam.async_read) for cam_key, cam in self.cameras.items()}
 
-        arm_state = {f"{k}.pos": v for k, v in arm_pos.items()}
-        obs_dict = {**arm_state, **base_vel}
+        obs_dict = self.get_motors_state()
 
-        dt_ms = (time.perf_counter() - start) * 1e3
-        logger.debug(f"Read motor state: {dt_ms:.1f}ms")
+        for cam_key, frame in frames.items():
+            try:
+                obs_dict[cam_key] = frame.result()
+            except DeviceNotConnectedError:
+                raise
+            except (ConnectionError, RuntimeError, TimeoutError) as e:
+                raise CameraError(f"Failed to read camera '{cam_key}': {e}") from e
+            if debug:
+                dt_ms = (time.perf_counter() - start) * 1e3
+                logger.debug(f"Read {cam_key}: {dt_ms:.1f}ms")
 
-        # Capture camera images
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"Read {cam_key}: {dt_ms:.1f}ms")
+        return obs_dict
+
+    async def get_observation_async(self) -> dict[str, Any]:
+        """Async variant of get_observation() for callers running on an event loop.
+
+        The motor read and each camera wait run as separate worker-thread tasks that are gathered,
+        so the event loop is never blocked and no pool thread sits waiting on the others.
+
+        Returns:
+            Dict with arm positions, base velocities, and camera images
+        """
+        if not self.is_connected:
+            raise RobotNotConnectedError("Robot not connected")
+
+        obs_dict, *frames = await asyncio.gather(
+            asyncio.to_thread(self.get_motors_state),
+            *(asyncio.to_thread(cam.async_read) for cam in self._cam_values),
+            return_exceptions=True,
+        )
+        if isinstance(obs_dict, BaseException):
+            raise obs_dict
+
+        for cam_key, frame in zip(self.cameras, frames, strict=True):
+            if isinstance(frame, DeviceNotConnectedError):
+                raise frame
+            if isinstance(frame, (ConnectionError, RuntimeError, TimeoutError)):
+                raise CameraError(f"Failed to read camera '{cam_key}': {frame}") from frame
+            if isinstance(frame, BaseException):
+                raise frame
+            obs_dict[cam_key] = frame
 
         return obs_dict
 
+    def get_arm_positions(self, max_age_s: float = 0.05) -> dict[str, float]:
+        """Get current arm motor positions without reading the base or cameras.
+
+        Args:
+            max_age_s: A previous read younger than this many seconds is returned instead of
+                issuing a new bus transaction.
+
+        Returns:
+            Dict mapping "<motor>.pos" keys to arm positions
+        """
+        if not self.is_connected:
+            raise RobotNotConnectedError("Robot not connected")
+
+        with self._bus_access():
+            return dict(self._recent_arm_pos(max_age_s))
+
+    def _recent_arm_pos(self, max_age_s: float) -> dict[str, float]:
+        """Return the cached arm positions if younger than `max_age_s`, else read them from the bus.
+
+        Must be called with the bus lock held. The returned dict is the cache entry itself.
+        """
+        now = time.perf_counter()
+        if self._last_arm_pos is not None and now - self._last_arm_pos[0] < max_age_s:
+            return self._last_arm_pos[1]
+
+        arm_pos = self.bus.sync_read("Present_Position", self._arm_motors)
+        arm_state = dict(zip(self._arm_pos_keys, arm_pos.values(), strict=True))
+        self._last_arm_pos = (now, arm_state)
+        return arm_state
+
     def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
         """Send action command to robot.
 
@@ -359,47 +568,75 @@ class LeKiwi:
             The action actually sent (may be clipped for safety)
         """
         if not self.is_connected:
-            raise DeviceNotConnectedError("Robot not connected")
-
-        arm_goal_pos = {k: v for k, v in action.items() if k.endswith(".pos")}
-        base_goal_vel = {k: v for k, v in action.items() if k.endswith(".vel")}
-
-        base_wheel_goal_vel = self._body_to_wheel_raw(
-            base_goal_vel["x.vel"], base_goal_vel["y.vel"], base_goal_vel["theta.vel"]
-        )
-
-        # Safety: cap goal position if too far from present
-        if self.config.max_relative_target is not None:
-            present_pos = self.bus.sync_read("Present_Position", self.arm_motors)
-            for key, g_pos in arm_goal_pos.items():
-                motor_name = key.replace(".pos", "")
-                p_pos = present_pos[motor_name]
-                max_rel = self.config.max_relative_target
-                if isinstance(max_rel, dict):
-                    max_rel = max_rel.get(motor_name, float("inf"))
-                if abs(g_pos - p_pos) > max_rel:
-                    arm_goal_pos[key] = p_pos + np.sign(g_pos - p_pos) * max_rel
-
-        # Send commands
-        arm_goal_pos_raw = {k.replace(".pos", ""): v for k, v in arm_goal_pos.items()}
-        self.bus.sync_write("Goal_Position", arm_goal_pos_raw)
-        self.bus.sync_write("Goal_Velocity", base_wheel_goal_vel)
+            raise RobotNotConnectedError("Robot not connected")
+
+        arm_goal_pos = {key: action[key] for key in self._arm_pos_keys if key in action}
+        base_goal_vel = {key: action[key] for key in self._BASE_VEL_KEYS}
+        base_cmd = tuple(base_goal_vel.values())
+
+        with self._bus_access():
+            # The wheels keep their goal velocity, so an unchanged base command needs no write
+            if base_cmd == self._last_base_cmd:
+                base_wheel_goal_vel = {}
+            else:
+                base_wheel_goal_vel = self._body_to_wheel_raw(*base_cmd)
+
+            # Safety: cap goal position if too far from present
+            if self._max_rel_arr is not None and arm_goal_pos:
+                present_pos = self._recent_arm_pos(self.config.present_pos_max_age)
+                n = len(arm_goal_pos)
+                goal = np.fromiter(arm_goal_pos.values(), dtype=np.float64, count=n)
+                present = np.fromiter(map(present_pos.__getitem__, arm_goal_pos), dtype=np.float64, count=n)
+                caps = self._max_rel_arr
+                if n != len(caps):
+                    caps = caps[[self._arm_pos_keys.index(key) for key in arm_goal_pos]]
+                # Goals within the caps pass through untouched; uncapped motors have caps of inf
+                capped = np.clip(goal, present - caps, present + caps)
+                arm_goal_pos = dict(zip(arm_goal_pos, capped.tolist(), strict=True))
+
+            # Only arm goals that moved past the deadband since they were last written
+            last_arm_cmd = self._last_arm_cmd
+            deadband = self.config.goal_pos_deadband
+            arm_goal_pos_raw = {}
+            for key, value in arm_goal_pos.items():
+                name = self._arm_name_from_poskey[key]
+                last = last_arm_cmd.get(name)
+                if last is None or abs(value - last) > deadband:
+                    arm_goal_pos_raw[name] = value
+
+            # Send both commands in one serial transfer, or nothing when the motors already hold them
+            if arm_goal_pos_raw or base_wheel_goal_vel:
+                self.bus.sync_write_multi(
+                    {"Goal_Position": arm_goal_pos_raw, "Goal_Velocity": base_wheel_goal_vel}
+                )
+                last_arm_cmd.update(arm_goal_pos_raw)
+                self._last_base_cmd = base_cmd
 
         return {**arm_goal_pos, **base_goal_vel}
 
     def stop_base(self):
         """Emergency stop for base motors."""
-        self.bus.sync_write("Goal_Velocity", dict.fromkeys(self.base_motors, 0), num_retry=5)
+        with self._bus_access():
+            self._forget_sent_commands()
+            self.bus.sync_write_multi(self._base_zero, num_retry=5)
         logger.info("Base motors stopped")
 
     def disconnect(self):
-        """Disconnect from robot hardware."""
+        """Disconnect from robot hardware.
+
+        The robot only reports disconnected once every device is closed. Devices already closed
+        by an earlier attempt that failed part-way are skipped, so the call can simply be retried.
+        """
         if not self.is_connected:
-            raise DeviceNotConnectedError("Robot not connected")
+            raise RobotNotConnectedError("Robot not connected")
 
-        self.stop_base()
-        self.bus.disconnect(self.config.disable_torque_on_disconnect)
-        for cam in self.cameras.values():
-            cam.disconnect()
+        if self.bus.is_connected:
+            self.stop_base()
+            with self._bus_access():
+                self.bus.disconnect(self.config.disable_torque_on_disconnect)
+        for cam in self._cam_values:
+            if cam.is_connected:
+                cam.disconnect()
 
+        self._connected = False
         logger.info("LeKiwi robot disconnected")
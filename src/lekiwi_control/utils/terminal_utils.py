@@ -1,15 +1,34 @@
 #!/usr/bin/env python
 
-# ABOUTME: Terminal utility functions for motor bus calibration
-# ABOUTME: Provides keyboard input checking and cursor manipulation
+# ABOUTME: Terminal and serial-port utility functions for the motor bus
+# ABOUTME: Provides keyboard input checking, cursor manipulation and USB-serial latency tuning
 
+import logging
+import os
 import platform
 import select
+import struct
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# From <linux/serial.h>: flags is the fifth int of struct serial_struct
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 1 << 13
+_SERIAL_FLAGS_OFFSET = 16
 
 
 def enter_pressed() -> bool:
-    """Check if the enter key was pressed (non-blocking)."""
+    """Check if the enter key was pressed (non-blocking).
+
+    On POSIX only the bytes already waiting on stdin are consumed, so a partially typed line never
+    blocks the caller. Inside `raw_stdin()` keys arrive one by one instead of per line. End of
+    input also counts as enter.
+    """
     if platform.system() == "Windows":
         import msvcrt
 
@@ -18,9 +37,85 @@ def enter_pressed() -> bool:
             return key in (b"\r", b"\n")  # enter key
         return False
     else:
-        return select.select([sys.stdin], [], [], 0)[0] and sys.stdin.readline().strip() == ""
+        fd = sys.stdin.fileno()
+        if not select.select([fd], [], [], 0)[0]:
+            return False
+        data = os.read(fd, 64)
+        # EOF (e.g. piped stdin that ran out) counts as enter, like an empty readline() did
+        return not data or b"\n" in data or b"\r" in data
+
+
+@contextmanager
+def raw_stdin() -> Iterator[None]:
+    """Put the stdin terminal in cbreak mode for polling with `enter_pressed()`.
+
+    The file flags are left alone: stdin usually shares its open file description with stdout, so
+    making it non-blocking would make prints fail once the terminal falls behind. `enter_pressed()`
+    only reads after select() reports input. The previous terminal attributes are restored on exit.
+    Does nothing on Windows or when stdin is not a terminal.
+    """
+    if platform.system() == "Windows" or not sys.stdin.isatty():
+        yield
+        return
+
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
 
 
 def move_cursor_up(lines):
     """Move the cursor up by a specified number of lines."""
     print(f"\033[{lines}A", end="")
+
+
+def set_serial_low_latency(port: str) -> bool:
+    """Make the kernel deliver USB-serial reads immediately instead of batching them.
+
+    FTDI-style adapters hold received bytes for up to `latency_timer` ms (16 by default) before
+    handing them to the host, which adds that delay to every motor bus round-trip. The timer is set
+    to 1 ms through sysfs when the driver exposes it; otherwise the port gets the
+    `ASYNC_LOW_LATENCY` flag through `TIOCSSERIAL`. Only supported on Linux; failures are logged
+    at debug level and never raised.
+
+    Args:
+        port: Serial device path, e.g. "/dev/ttyUSB0" or a /dev/serial/by-id symlink
+
+    Returns:
+        True if one of the settings was applied
+    """
+    if platform.system() != "Linux":
+        return False
+
+    device = os.path.realpath(port)
+    latency_timer = Path("/sys/bus/usb-serial/devices") / os.path.basename(device) / "latency_timer"
+    try:
+        latency_timer.write_text("1")
+        logger.debug(f"Set {latency_timer} to 1 ms")
+        return True
+    except OSError as e:
+        logger.debug(f"Could not set USB-serial latency timer for {device}: {e}")
+
+    try:
+        import fcntl
+
+        fd = os.open(device, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            buf = bytearray(1024)
+            fcntl.ioctl(fd, _TIOCGSERIAL, buf)
+            (flags,) = struct.unpack_from("i", buf, _SERIAL_FLAGS_OFFSET)
+            struct.pack_into("i", buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+            fcntl.ioctl(fd, _TIOCSSERIAL, buf)
+        finally:
+            os.close(fd)
+        logger.debug(f"Set ASYNC_LOW_LATENCY on {device}")
+        return True
+    except OSError as e:
+        logger.debug(f"Could not set ASYNC_LOW_LATENCY on {device}: {e}")
+        return False